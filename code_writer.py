@@ -3,6 +3,7 @@ import json
 import os
 import subprocess
 import sys
+import time
 import traceback
 from loguru import logger
 from matplotlib import pyplot as plt
@@ -10,6 +11,7 @@ import streamlit as st
 from dotenv import load_dotenv
 from llm import LLM, EnvMessage, HumanMessage, SystemMessage, AIMessage, from_raw_message
 from editor import get_code_editor
+from validation import validate_code
 
 load_dotenv()
 
@@ -205,7 +207,18 @@ def main():
                 get_code_editor(content["code"], language=content["language"])
 
             with st.chat_message("env", avatar="🖥"):
-                ret, has_error = execute_and_capture_output(content["code"], content["language"])
+                # Validate the code before running it so that obvious errors don't cost a full execution
+                start = time.perf_counter()
+                ret, cache_hit = validate_code(content["code"], content["language"])
+                elapsed = (time.perf_counter() - start) * 1000
+                logger.debug(f"validation: {elapsed:.1f} ms (cache {'hit' if cache_hit else 'miss'})")
+
+                if ret is not None:
+                    has_error = True
+                else:
+                    start = time.perf_counter()
+                    ret, has_error = execute_and_capture_output(content["code"], content["language"])
+                    logger.debug(f"execution: {(time.perf_counter() - start) * 1000:.1f} ms")
                 st.code(ret)
                 st.session_state.messages.append(EnvMessage(content=ret))
 
@@ -0,0 +1,82 @@
+import sys
+
+import pytest
+
+from validation import check_syntax, validate_code
+
+
+@pytest.fixture(autouse=True)
+def session_dir(tmp_path, monkeypatch):
+    # main() runs the code in the session directory
+    monkeypatch.chdir(tmp_path)
+    check_syntax.cache_clear()
+    return tmp_path
+
+
+def test_syntax_error():
+    error, _ = validate_code("print(1", "python")
+    assert "SyntaxError" in error
+
+
+def test_null_bytes():
+    error, _ = validate_code("print(1)\0", "python")
+    assert error is not None
+
+
+def test_missing_import():
+    error, _ = validate_code('"""docstring"""\nimport os\nimport no_such_module_xyz', "python")
+    assert error == "ModuleNotFoundError: No module named 'no_such_module_xyz'"
+
+
+def test_guarded_import():
+    code = "try:\n    import no_such_module_xyz as json\nexcept ImportError:\n    import json\n"
+    assert validate_code(code, "python")[0] is None
+
+
+def test_import_in_function():
+    code = "def f():\n    import no_such_module_xyz\n"
+    assert validate_code(code, "python")[0] is None
+
+
+def test_import_after_pip_install():
+    code = (
+        "import subprocess\nimport sys\n"
+        'subprocess.check_call([sys.executable, "-m", "pip", "install", "no_such_module_xyz"])\n'
+        "import no_such_module_xyz\n"
+    )
+    assert validate_code(code, "python")[0] is None
+
+
+def test_import_after_sys_path_change():
+    code = 'import sys\nsys.path.append("/opt/lib")\nimport no_such_module_xyz\n'
+    assert validate_code(code, "python")[0] is None
+
+
+def test_import_main():
+    assert validate_code("import __main__", "python")[0] is None
+
+
+def test_module_in_session_dir(session_dir, monkeypatch):
+    (session_dir / "my_local_module.py").write_text("x = 1\n")
+    code = "import my_local_module"
+
+    # The session directory is not on sys.path under streamlit, so exec could not import it either
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p not in ("", str(session_dir))])
+    assert validate_code(code, "python")[0] is not None
+
+    # The import check is not cached, so a change to sys.path is picked up
+    monkeypatch.syspath_prepend(str(session_dir))
+    error, cache_hit = validate_code(code, "python")
+    assert error is None
+    assert cache_hit
+
+
+def test_sh_syntax_error():
+    error, _ = validate_code("if then; fi", "sh")
+    assert "syntax error" in error
+    assert validate_code("echo hi", "sh")[0] is None
+
+
+def test_cache_hit():
+    assert validate_code("print(1)", "python") == (None, False)
+    assert validate_code("print(1)", "python") == (None, True)
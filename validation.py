@@ -0,0 +1,96 @@
+import ast
+import importlib
+import importlib.util
+import subprocess
+import sys
+import traceback
+from functools import lru_cache
+
+
+def leading_imports(tree):
+    """Yields the imports at the top of the module, before any other statement runs.
+
+    Anything after the first other statement (e.g. a pip install or a sys.path change) may affect what can be
+    imported, so those imports are left to the execution. So are imports inside try/except, if branches and
+    function bodies, which may be optional fallbacks.
+    """
+    for i, node in enumerate(tree.body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif i == 0 and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            # module docstring
+            continue
+        else:
+            break
+
+
+def find_missing_imports(tree):
+    # Packages may have been installed since the last check, e.g. by a previous sh step
+    importlib.invalidate_caches()
+
+    missing = []
+    for node in leading_imports(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+
+        for name in names:
+            # Only look up the top-level package so that nothing gets imported.
+            # The lookup uses sys.path like exec does; note that under streamlit the session directory
+            # (the current directory) is not on sys.path, so modules placed there are not importable either.
+            top_level = name.split(".")[0]
+            if top_level in missing:
+                continue
+            try:
+                spec = importlib.util.find_spec(top_level)
+            except (ImportError, ValueError):
+                # e.g. __main__ has no spec under streamlit; let the execution decide
+                continue
+            if spec is None:
+                missing.append(top_level)
+
+    return missing
+
+
+@lru_cache(maxsize=128)
+def check_syntax(code, language):
+    """Returns (error message or None, parsed tree or None). Depends only on the code, so the result is cached."""
+    if language == "python":
+        try:
+            tree = ast.parse(code)
+            compile(tree, "<string>", "exec")
+        except (SyntaxError, ValueError, RecursionError, MemoryError):
+            return "".join(traceback.format_exception_only(*sys.exc_info()[:2])), None
+        return None, tree
+
+    elif language == "sh":
+        try:
+            # bash -n parses the script without executing any command
+            result = subprocess.run(["bash", "-n", "-c", code], capture_output=True, text=True)
+        except Exception as e:
+            return str(e), None
+        return (result.stderr if result.returncode != 0 else None), None
+
+    else:
+        return "Unsupported language", None
+
+
+def validate_code(code, language):
+    """Check the code without running it.
+
+    Returns (error message or None if no problem was found, whether the syntax check was a cache hit).
+    Import resolution depends on the environment, so it is redone every time.
+    """
+    hits = check_syntax.cache_info().hits
+    error, tree = check_syntax(code, language)
+    cache_hit = check_syntax.cache_info().hits > hits
+
+    if error is None and tree is not None:
+        missing = find_missing_imports(tree)
+        if missing:
+            error = "\n".join(f"ModuleNotFoundError: No module named '{name}'" for name in missing)
+
+    return error, cache_hit